@@ -1,8 +1,22 @@
 import streamlit as st
-import pandas as pd
 import os
+import glob
+import time
+import hashlib
+import tempfile
 from datetime import datetime
-from io import BytesIO
+from importlib.util import find_spec
+
+# pandas, openpyxl and io are imported inside the helpers so the landing
+# page renders before any data libraries are loaded
+HAS_CALAMINE = find_spec("python_calamine") is not None
+
+# Parquet cache of parsed GL dumps; bump the version whenever the parse
+# settings or the post-read conversion change
+GL_CACHE_VERSION = 1
+GL_CACHE_MAX_AGE = 24 * 60 * 60
+GL_DUMP_USECOLS = [1, 6, 12]
+GL_DUMP_NAMES = ['GL_Code', 'Order', 'Amount']
 
 # Set page config
 st.set_page_config(page_title="GL Recovery Dashboard - Cloud", layout="wide", initial_sidebar_state="expanded")
@@ -43,60 +57,410 @@ uploaded_gl_desc = st.sidebar.file_uploader(
 
 # ============= HELPER FUNCTIONS =============
 
-def load_gl_dump_from_upload(file):
-    """Load GL dump from uploaded file"""
+def hash_dataframe(df):
+    """Cache key for a DataFrame argument"""
+    import pandas as pd
+    return df.shape, pd.util.hash_pandas_object(df, index=False).values.tobytes()
+
+def read_excel_bytes(data, usecols=None, names=None):
+    """Read the first sheet of an xlsx file, with calamine or streaming openpyxl"""
+    import pandas as pd
+    from io import BytesIO
+    if HAS_CALAMINE:
+        return pd.read_excel(
+            BytesIO(data),
+            engine="calamine",
+            usecols=usecols,
+            names=names
+        )
+    
+    from openpyxl import load_workbook
+    
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True)
     try:
-        df = pd.read_excel(file)
-        return df
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows)
+        if usecols is not None:
+            # Rows are only padded to the sheet's <dimension>, which can be
+            # missing, so blank trailing cells may be absent entirely
+            header = [header[i] if i < len(header) else None for i in usecols]
+            rows = ([row[i] if i < len(row) else None for i in usecols] for row in rows)
+        df = pd.DataFrame(list(rows), columns=names or header)
+    finally:
+        wb.close()
+    return df
+
+def prune_gl_cache(cache_dir):
+    """Delete cached GL dumps not used within GL_CACHE_MAX_AGE"""
+    cutoff = time.time() - GL_CACHE_MAX_AGE
+    for path in glob.glob(os.path.join(cache_dir, "gl_cache_*.parquet")):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+@st.cache_data(show_spinner=False)
+def load_gl_dump_from_upload(data):
+    """Load GL dump from uploaded file bytes, via a Parquet cache on disk"""
+    import pandas as pd
+    
+    hasher = hashlib.sha256(data)
+    hasher.update(repr((GL_DUMP_USECOLS, GL_DUMP_NAMES)).encode())
+    cache_dir = tempfile.gettempdir()
+    cache_path = os.path.join(cache_dir, f"gl_cache_v{GL_CACHE_VERSION}_{hasher.hexdigest()}.parquet")
+    prune_gl_cache(cache_dir)
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            # Refresh the mtime so files in use are not pruned
+            os.utime(cache_path)
+            return df
+        except Exception:
+            pass
+    
+    try:
+        # Only the GL code (B), order (G) and amount (M) columns are used
+        df = read_excel_bytes(data, usecols=GL_DUMP_USECOLS, names=GL_DUMP_NAMES)
+        # GL_Code and Order keep their cell types so codes still match the
+        # description keys; only Amount is parsed to a number up front
+        df['Amount'] = pd.to_numeric(df['Amount'], errors='coerce')
     except:
         st.error("❌ Error reading GL dump file")
         return None
+    
+    # The cache is best effort; mixed-type columns can fail to serialise
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".parquet.tmp", dir=cache_dir)
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except Exception:
+        pass
+    return df
 
-def load_gl_descriptions_from_upload(file):
-    """Load GL descriptions from uploaded file"""
+@st.cache_data(show_spinner=False)
+def load_gl_descriptions_from_upload(data):
+    """Load GL descriptions from uploaded file bytes"""
     try:
-        df = pd.read_excel(file)
-        gl_name_dict = dict(zip(df.iloc[:, 0], df.iloc[:, 1]))
-        gl_category_dict = dict(zip(df.iloc[:, 0], df.iloc[:, 2])) if len(df.columns) >= 3 else {}
+        df = read_excel_bytes(data)
+        df = df.set_index(df.columns[0])
+        gl_name_dict = df.iloc[:, 0].to_dict()
+        gl_category_dict = df.iloc[:, 1].to_dict() if len(df.columns) >= 2 else {}
         return gl_name_dict, gl_category_dict
     except:
         st.error("❌ Error reading GL Description file")
         return {}, {}
 
-def get_gl_name(gl_code, gl_dict):
-    return gl_dict.get(gl_code, "Unknown GL")
+def to_csv_buffer(df):
+    """Write DataFrame as CSV into an in-memory bytes buffer"""
+    from io import BytesIO
+    buffer = BytesIO()
+    df.to_csv(buffer, index=False, chunksize=50_000)
+    return buffer
 
-def get_gl_category(gl_code, gl_cat_dict):
-    return gl_cat_dict.get(gl_code, "Uncategorized")
+def show_summary(df, max_rows=500, large_rows=10_000):
+    """Display a sorted summary, capped to its top rows when it is large"""
+    if len(df) > large_rows:
+        st.caption(f"Showing top {max_rows:,} of {len(df):,} rows. Download the CSV for all rows.")
+        df = df.head(max_rows)
+    st.dataframe(df, use_container_width=True)
 
+@st.cache_data(show_spinner=False, hash_funcs={"pandas.core.frame.DataFrame": hash_dataframe})
 def process_gl_data(df, gl_name_dict, gl_category_dict):
     """Process GL data"""
-    df_copy = df.copy()
-    df_copy.columns = range(len(df_copy.columns))
+    import pandas as pd
     
-    gl_col = 1
-    order_col = 6
-    amount_col = 12
+    amount = pd.to_numeric(df['Amount'], errors='coerce')
+    has_amount = amount.notna().to_numpy()
     
-    df_copy['GL_Code'] = df_copy[gl_col]
-    df_copy['Order'] = df_copy[order_col]
-    df_copy['Amount'] = pd.to_numeric(df_copy[amount_col], errors='coerce')
-    df_copy['GL_Description'] = df_copy['GL_Code'].apply(lambda x: get_gl_name(x, gl_name_dict))
-    df_copy['Category'] = df_copy['GL_Code'].apply(lambda x: get_gl_category(x, gl_category_dict))
+    out = pd.DataFrame({
+        'GL_Code': df['GL_Code'].values[has_amount],
+        'Order': df['Order'].values[has_amount],
+        'Amount': amount.values[has_amount]
+    })
+    out['GL_Description'] = out['GL_Code'].map(gl_name_dict).fillna("Unknown GL")
+    out['Category'] = out['GL_Code'].map(gl_category_dict).fillna("Uncategorized")
     
-    df_copy = df_copy.dropna(subset=['Amount'])
+    # Amount stays float64; float32 cannot hold AED cents exactly
+    if pd.api.types.is_numeric_dtype(out['Order']):
+        out['Order'] = pd.to_numeric(out['Order'], downcast='unsigned')
     
-    return df_copy[['GL_Code', 'GL_Description', 'Category', 'Order', 'Amount']]
+    for col in ('GL_Code', 'GL_Description', 'Category', 'Order'):
+        out[col] = out[col].astype('category')
+        # Arrow (st.dataframe) and sorted() cannot handle mixed int/str labels,
+        # so those columns get string labels once the lookups above are done
+        if pd.api.types.infer_dtype(out[col].cat.categories) in ('mixed', 'mixed-integer'):
+            out[col] = out[col].map(str, na_action='ignore').astype('category')
+    
+    return out[['GL_Code', 'GL_Description', 'Category', 'Order', 'Amount']]
+
+def order_strings(orders):
+    """Per-row strings of a categorical Order column; missing orders are ''"""
+    import numpy as np
+    labels = np.append(orders.cat.categories.astype(str).to_numpy(dtype=object), '')
+    # Missing values have code -1, which picks the trailing ''
+    return labels[orders.cat.codes.to_numpy()]
+
+@st.cache_resource(
+    max_entries=2,
+    show_spinner="Building order search index...",
+    hash_funcs={"pandas.core.frame.DataFrame": hash_dataframe}
+)
+def build_order_index(df):
+    """Map each order-string trigram to the sorted row positions containing it"""
+    import numpy as np
+    from collections import defaultdict
+    
+    postings = defaultdict(list)
+    for row, order in enumerate(order_strings(df['Order'])):
+        for trigram in {order[i:i + 3] for i in range(len(order) - 2)}:
+            postings[trigram].append(row)
+    return {trigram: np.array(rows, dtype=np.int32) for trigram, rows in postings.items()}
+
+def find_order_rows(df, query):
+    """Row positions whose order string contains query"""
+    import numpy as np
+    from functools import reduce
+    
+    orders = df['Order']
+    if len(query) < 3:
+        # Match the unique order labels once, then broadcast to rows by code
+        hits = orders.cat.categories.astype(str).str.contains(query, regex=False)
+        return np.flatnonzero(np.append(hits, False)[orders.cat.codes.to_numpy()])
+    
+    index = build_order_index(df)
+    trigrams = {query[i:i + 3] for i in range(len(query) - 2)}
+    if not trigrams <= index.keys():
+        return np.array([], dtype=np.int32)
+    postings = sorted((index[trigram] for trigram in trigrams), key=len)
+    rows = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings)
+    
+    # Sharing every trigram does not guarantee a contiguous match
+    candidates = order_strings(orders.iloc[rows])
+    return rows[np.array([query in order for order in candidates], dtype=bool)]
+
+def sync_deselected_gls(all_gls):
+    """Record GL multiselect changes before the page reruns"""
+    shown = set(all_gls)
+    selected = set(st.session_state.gl_select)
+    st.session_state.deselected_gls = (st.session_state.deselected_gls - shown) | (shown - selected)
+
+# ============= PAGES =============
+
+@st.fragment
+def dashboard_home(processed_data, all_categories):
+    """Dashboard Home page"""
+    st.subheader("📊 Recovery Summary Dashboard")
+    
+    # Category filter
+    st.subheader("🏷️ Filter by Category")
+    selected_categories = st.multiselect(
+        "Categories",
+        options=all_categories,
+        default=all_categories,
+        key="cat_select"
+    )
+    
+    if not selected_categories:
+        selected_categories = all_categories
+    
+    filtered_by_cat = processed_data[processed_data['Category'].isin(selected_categories)]
+    
+    st.markdown("---")
+    
+    # Summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📊 GL Codes", filtered_by_cat['GL_Code'].nunique())
+    with col2:
+        st.metric("👥 Orders/IOs", filtered_by_cat['Order'].nunique())
+    with col3:
+        st.metric("💵 Total Amount (AED)", f"{filtered_by_cat['Amount'].sum():,.2f}")
+    with col4:
+        st.metric("📈 Records", len(filtered_by_cat))
+    
+    st.markdown("---")
+    
+    # GL Selection
+    st.subheader("✅ Select GL Codes to Include")
+    gl_name_lookup = filtered_by_cat.groupby('GL_Code', observed=True, sort=False)['GL_Description'].first().to_dict()
+    all_gls = sorted(gl_name_lookup)
+    
+    # Deselected GLs live in session state so they survive category changes;
+    # the widget value is rebuilt from them for the current options each run
+    deselected_gls = st.session_state.setdefault('deselected_gls', set())
+    st.session_state.gl_select = [gl_code for gl_code in all_gls if gl_code not in deselected_gls]
+    selected_gls = st.multiselect(
+        "GL Codes",
+        options=all_gls,
+        format_func=lambda gl_code: f"{gl_code} - {gl_name_lookup[gl_code][:30]}",
+        key="gl_select",
+        on_change=sync_deselected_gls,
+        args=(all_gls,)
+    )
+    
+    if not selected_gls:
+        selected_gls = all_gls
+    
+    final_filtered = filtered_by_cat[filtered_by_cat['GL_Code'].isin(selected_gls)]
+    
+    st.markdown("---")
+    
+    # GL Summary
+    st.subheader("💼 Summary by GL Code")
+    gl_summary = final_filtered.groupby(['GL_Code', 'GL_Description', 'Category'], observed=True, sort=False).agg(
+        total=('Amount', 'sum'),
+        n=('Order', 'count')
+    ).reset_index()
+    gl_summary.columns = ['GL Code', 'GL Description', 'Category', 'Total Amount (AED)', 'Number of Records']
+    gl_summary = gl_summary.sort_values('Total Amount (AED)', ascending=False)
+    
+    show_summary(gl_summary)
+    
+    st.download_button(
+        label="📥 Download GL Summary as CSV",
+        data=to_csv_buffer(gl_summary),
+        file_name=f"GL_Summary_{st.session_state.session_ts}.csv",
+        mime="text/csv"
+    )
+    
+    st.markdown("---")
+    
+    # Order Summary
+    st.subheader("👥 Summary by Order/IO")
+    order_summary = final_filtered.groupby('Order', observed=True, sort=False).agg(
+        total=('Amount', 'sum'),
+        n=('GL_Code', 'count')
+    ).reset_index()
+    order_summary.columns = ['Order/IO', 'Total Amount (AED)', 'Number of GLs']
+    order_summary = order_summary.sort_values('Total Amount (AED)', ascending=False)
+    
+    show_summary(order_summary)
+    
+    st.download_button(
+        label="📥 Download Order Summary as CSV",
+        data=to_csv_buffer(order_summary),
+        file_name=f"Order_Summary_{st.session_state.session_ts}.csv",
+        mime="text/csv"
+    )
+
+@st.fragment
+def query_employee(processed_data, all_categories):
+    """Query Employee page"""
+    st.subheader("🔍 Query Recoveries by Employee/IO")
+    
+    # Category filter
+    st.subheader("🏷️ Filter by Category (Optional)")
+    selected_categories_query = st.multiselect(
+        "Categories",
+        options=all_categories,
+        default=all_categories,
+        key="query_cat_select"
+    )
+    
+    if not selected_categories_query:
+        selected_categories_query = all_categories
+    
+    st.markdown("---")
+    
+    # Query input
+    order_input = st.text_input(
+        "Enter Order/Internal Order (IO) or Employee ID:",
+        placeholder="e.g., 30102204"
+    )
+    
+    if st.button("🔍 Search Recoveries", key="search_btn"):
+        if order_input.strip():
+            query = order_input.strip()
+            matches = processed_data.iloc[find_order_rows(processed_data, query)]
+            matches = matches[matches['Category'].isin(selected_categories_query)]
+            exact = order_strings(matches['Order']) == query
+            filtered_data = matches[exact] if exact.any() else matches
+            
+            if not filtered_data.empty:
+                st.success(f"✅ Found {len(filtered_data)} records for Order: {order_input}")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Amount (AED)", f"{filtered_data['Amount'].sum():,.2f}")
+                with col2:
+                    st.metric("Number of GLs", filtered_data['GL_Code'].nunique())
+                with col3:
+                    st.metric("Number of Categories", filtered_data['Category'].nunique())
+                
+                st.markdown("---")
+                
+                st.subheader("📊 Category-wise Breakdown")
+                category_summary = filtered_data.groupby('Category', observed=True, sort=False).agg(
+                    total=('Amount', 'sum'),
+                    n=('GL_Code', 'count')
+                ).reset_index()
+                category_summary.columns = ['Category', 'Amount (AED)', 'Number of GLs']
+                st.dataframe(category_summary, use_container_width=True)
+                
+                st.markdown("---")
+                
+                st.subheader("📋 GL-wise Breakdown")
+                detailed = filtered_data.groupby(['GL_Code', 'GL_Description', 'Category'], observed=True, sort=False).agg(
+                    total=('Amount', 'sum')
+                ).reset_index()
+                detailed.columns = ['GL Code', 'GL Description', 'Category', 'Amount (AED)']
+                st.dataframe(detailed, use_container_width=True)
+                
+                st.download_button(
+                    label="📥 Download Details as CSV",
+                    data=to_csv_buffer(detailed),
+                    file_name=f"Recoveries_{order_input}_{st.session_state.session_ts}.csv",
+                    mime="text/csv"
+                )
+            else:
+                st.warning(f"⚠️ No records found for Order: {order_input}")
+        else:
+            st.warning("⚠️ Please enter an Order/IO")
+
+def settings_page(processed_data, all_categories):
+    """Settings page"""
+    st.subheader("⚙️ System Settings & Status")
+    
+    st.info("📊 Data Summary:")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total GL Codes", processed_data['GL_Code'].nunique())
+    with col2:
+        st.metric("Total Orders", processed_data['Order'].nunique())
+    with col3:
+        st.metric("Total Categories", len(all_categories))
+    with col4:
+        st.metric("Total Records", len(processed_data))
+    
+    st.markdown("---")
+    
+    st.subheader("🏷️ Categories Found")
+    st.write(", ".join(all_categories))
+    
+    st.markdown("---")
+    
+    st.subheader("📊 Data Preview")
+    st.write("First 10 rows of processed GL data:")
+    st.dataframe(processed_data.head(10), use_container_width=True)
 
 # ============= MAIN APP =============
 
+if 'session_ts' not in st.session_state:
+    st.session_state.session_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+
 if uploaded_gl_dump and uploaded_gl_desc:
-    gl_dump = load_gl_dump_from_upload(uploaded_gl_dump)
-    gl_name_dict, gl_category_dict = load_gl_descriptions_from_upload(uploaded_gl_desc)
+    gl_dump = load_gl_dump_from_upload(uploaded_gl_dump.getvalue())
+    gl_name_dict, gl_category_dict = load_gl_descriptions_from_upload(uploaded_gl_desc.getvalue())
     
     if gl_dump is not None:
         processed_data = process_gl_data(gl_dump, gl_name_dict, gl_category_dict)
-        all_categories = sorted([cat for cat in processed_data['Category'].unique().tolist() if cat != 'Uncategorized'])
+        all_categories = sorted(cat for cat in processed_data['Category'].cat.categories if cat != 'Uncategorized')
         
         # Sidebar navigation
         with st.sidebar:
@@ -107,195 +471,11 @@ if uploaded_gl_dump and uploaded_gl_desc:
             )
         
         if page == "📊 Dashboard Home":
-            st.subheader("📊 Recovery Summary Dashboard")
-            
-            # Category filter
-            st.subheader("🏷️ Filter by Category")
-            col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-            selected_categories = []
-            
-            for idx, cat in enumerate(all_categories):
-                col = [col1, col2, col3, col4][idx % 4]
-                if col.checkbox(cat, value=True, key=f"cat_{idx}"):
-                    selected_categories.append(cat)
-            
-            if not selected_categories:
-                selected_categories = all_categories
-            
-            filtered_by_cat = processed_data[processed_data['Category'].isin(selected_categories)]
-            
-            st.markdown("---")
-            
-            # Summary metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("📊 GL Codes", filtered_by_cat['GL_Code'].nunique())
-            with col2:
-                st.metric("👥 Orders/IOs", filtered_by_cat['Order'].nunique())
-            with col3:
-                st.metric("💵 Total Amount (AED)", f"{filtered_by_cat['Amount'].sum():,.2f}")
-            with col4:
-                st.metric("📈 Records", len(filtered_by_cat))
-            
-            st.markdown("---")
-            
-            # GL Selection
-            st.subheader("✅ Select GL Codes to Include")
-            all_gls = sorted(filtered_by_cat['GL_Code'].unique().tolist())
-            
-            col1, col2, col3 = st.columns(3)
-            selected_gls = []
-            
-            for idx, gl_code in enumerate(all_gls):
-                gl_name = filtered_by_cat[filtered_by_cat['GL_Code'] == gl_code]['GL_Description'].iloc[0]
-                col = [col1, col2, col3][idx % 3]
-                
-                if col.checkbox(f"{gl_code} - {gl_name[:30]}", value=True, key=f"gl_{gl_code}"):
-                    selected_gls.append(gl_code)
-            
-            if not selected_gls:
-                selected_gls = all_gls
-            
-            final_filtered = filtered_by_cat[filtered_by_cat['GL_Code'].isin(selected_gls)]
-            
-            st.markdown("---")
-            
-            # GL Summary
-            st.subheader("💼 Summary by GL Code")
-            gl_summary = final_filtered.groupby(['GL_Code', 'GL_Description', 'Category']).agg({
-                'Amount': 'sum',
-                'Order': 'count'
-            }).reset_index()
-            gl_summary.columns = ['GL Code', 'GL Description', 'Category', 'Total Amount (AED)', 'Number of Records']
-            gl_summary = gl_summary.sort_values('Total Amount (AED)', ascending=False)
-            
-            st.dataframe(gl_summary, use_container_width=True)
-            
-            csv_gl = gl_summary.to_csv(index=False)
-            st.download_button(
-                label="📥 Download GL Summary as CSV",
-                data=csv_gl,
-                file_name=f"GL_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
-            
-            st.markdown("---")
-            
-            # Order Summary
-            st.subheader("👥 Summary by Order/IO")
-            order_summary = final_filtered.groupby('Order').agg({
-                'Amount': 'sum',
-                'GL_Code': 'count'
-            }).reset_index()
-            order_summary.columns = ['Order/IO', 'Total Amount (AED)', 'Number of GLs']
-            order_summary = order_summary.sort_values('Total Amount (AED)', ascending=False)
-            
-            st.dataframe(order_summary, use_container_width=True)
-            
-            csv_order = order_summary.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Order Summary as CSV",
-                data=csv_order,
-                file_name=f"Order_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
-        
+            dashboard_home(processed_data, all_categories)
         elif page == "🔍 Query Employee":
-            st.subheader("🔍 Query Recoveries by Employee/IO")
-            
-            # Category filter
-            st.subheader("🏷️ Filter by Category (Optional)")
-            selected_categories_query = []
-            col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-            
-            for idx, cat in enumerate(all_categories):
-                col = [col1, col2, col3, col4][idx % 4]
-                if col.checkbox(cat, value=True, key=f"query_cat_{idx}"):
-                    selected_categories_query.append(cat)
-            
-            if not selected_categories_query:
-                selected_categories_query = all_categories
-            
-            filtered_by_cat_query = processed_data[processed_data['Category'].isin(selected_categories_query)]
-            
-            st.markdown("---")
-            
-            # Query input
-            order_input = st.text_input(
-                "Enter Order/Internal Order (IO) or Employee ID:",
-                placeholder="e.g., 30102204"
-            )
-            
-            if st.button("🔍 Search Recoveries", key="search_btn"):
-                if order_input.strip():
-                    filtered_data = filtered_by_cat_query[filtered_by_cat_query['Order'].astype(str).str.contains(order_input.strip(), na=False)]
-                    
-                    if not filtered_data.empty:
-                        st.success(f"✅ Found {len(filtered_data)} records for Order: {order_input}")
-                        
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Total Amount (AED)", f"{filtered_data['Amount'].sum():,.2f}")
-                        with col2:
-                            st.metric("Number of GLs", filtered_data['GL_Code'].nunique())
-                        with col3:
-                            st.metric("Number of Categories", filtered_data['Category'].nunique())
-                        
-                        st.markdown("---")
-                        
-                        st.subheader("📊 Category-wise Breakdown")
-                        category_summary = filtered_data.groupby('Category').agg({
-                            'Amount': 'sum',
-                            'GL_Code': 'count'
-                        }).reset_index()
-                        category_summary.columns = ['Category', 'Amount (AED)', 'Number of GLs']
-                        st.dataframe(category_summary, use_container_width=True)
-                        
-                        st.markdown("---")
-                        
-                        st.subheader("📋 GL-wise Breakdown")
-                        detailed = filtered_data.groupby(['GL_Code', 'GL_Description', 'Category']).agg({
-                            'Amount': 'sum'
-                        }).reset_index()
-                        detailed.columns = ['GL Code', 'GL Description', 'Category', 'Amount (AED)']
-                        st.dataframe(detailed, use_container_width=True)
-                        
-                        csv_detail = detailed.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download Details as CSV",
-                            data=csv_detail,
-                            file_name=f"Recoveries_{order_input}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.warning(f"⚠️ No records found for Order: {order_input}")
-                else:
-                    st.warning("⚠️ Please enter an Order/IO")
-        
+            query_employee(processed_data, all_categories)
         elif page == "⚙️ Settings":
-            st.subheader("⚙️ System Settings & Status")
-            
-            st.info("📊 Data Summary:")
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total GL Codes", processed_data['GL_Code'].nunique())
-            with col2:
-                st.metric("Total Orders", processed_data['Order'].nunique())
-            with col3:
-                st.metric("Total Categories", len(all_categories))
-            with col4:
-                st.metric("Total Records", len(processed_data))
-            
-            st.markdown("---")
-            
-            st.subheader("🏷️ Categories Found")
-            st.write(", ".join(all_categories))
-            
-            st.markdown("---")
-            
-            st.subheader("📊 Data Preview")
-            st.write("First 10 rows of processed GL data:")
-            st.dataframe(processed_data.head(10), use_container_width=True)
+            settings_page(processed_data, all_categories)
 
 else:
     st.warning("⚠️ Please upload both GL_dump.xlsx and GL_Description.xlsx files to get started!")